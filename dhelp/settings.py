@@ -27,6 +27,7 @@ NLTK_PACKAGES = {
         ),
         ('maxent_ne_chunker', ['chunkers', 'maxent_ne_chunker.zip']),
         ('universal_tagset', ['taggers', 'universal_tagset.zip']),
+        ('stopwords', ['corpora', 'stopwords.zip']),
     ],
     'english': [
         ('words', ['corpora', 'words.zip']),
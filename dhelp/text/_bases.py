@@ -1,7 +1,110 @@
 #!/usr/bin/python
 
+import os
 import re
 from collections import UserString
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+
+
+_NEWLINES_RE = re.compile(r'\n+')
+_SPACES_RE = re.compile(r'\s+')
+# dashes left at a (collapsed) line break, removed to rejoin split words
+_DASHES_RE = re.compile(r' - |- | -')
+# runs of anything other than latin (or greek) letters and spaces
+_NON_LATIN_RE = re.compile(r'[^A-Za-z ]+')
+_NON_GREEK_RE = re.compile(r'[^ʹ-Ϋά-ϡἀ-ᾯᾰ-῾ ]+')
+
+# every byte which is not an ascii letter or a space, used to filter ascii-only
+# latin texts in a single pass with bytes.translate
+_LATIN_DELETE_BYTES = bytes(
+    byte for byte in range(256)
+    if not (chr(byte).isalpha() and byte < 128) and byte != ord(' ')
+)
+
+# text inside any kind of editorial mark, matched with negated classes so the
+# scan is linear, and like the old '.*?' patterns never spanning lines
+_EDITS_RE = re.compile(
+    r'\[[^\]\n]*\]|<[^>\n]*>|\([^)\n]*\)|\{[^}\n]*\}|〚[^〛\n]*〛'
+)
+
+
+@lru_cache(maxsize=1024)
+def _compile(pattern):
+    """Compiles a user-supplied pattern, reusing it on repeated searches."""
+    return re.compile(pattern)
+
+
+def _rm_lines(text):
+    """Collapses endlines to spaces, rejoining words split by a dash."""
+    return _DASHES_RE.sub('', _NEWLINES_RE.sub(' ', text))
+
+
+@lru_cache(maxsize=None)
+def _get_re2_edits():
+    """Compiles the editorial marks pattern with re2, imported on first use."""
+    import re2
+    return re2.compile(_EDITS_RE.pattern)
+
+
+def _rm_edits(text, use_re2=False):
+    """Drops text inside editorial marks, optionally with the re2 engine."""
+    if use_re2:
+        return _get_re2_edits().sub('', text)
+    return _EDITS_RE.sub('', text)
+
+
+def _rm_spaces(text):
+    """Collapses whitespace blocks to single spaces."""
+    return _SPACES_RE.sub(' ', text).strip()
+
+
+def _rm_nonchars(text, language):
+    """Drops everything but spaces and letters of the given language."""
+    if language == 'greek':
+        return _NON_GREEK_RE.sub('', text)
+    # ascii-only texts can skip the regex engine entirely
+    try:
+        return text.encode('ascii').translate(
+            None, _LATIN_DELETE_BYTES
+        ).decode('ascii')
+    except UnicodeEncodeError:
+        return _NON_LATIN_RE.sub('', text)
+
+
+def _clean(text, language, lines, edits, spaces, nonchars, use_re2=False):
+    """Runs the selected cleaning passes over a bare string."""
+    if lines:
+        text = _rm_lines(text)
+    if edits:
+        text = _rm_edits(text, use_re2)
+    if nonchars:
+        text = _rm_nonchars(text, language)
+    if spaces:
+        text = _rm_spaces(text)
+    return text
+
+
+# read-only options shared by every text with the same settings
+_FROZEN_OPTIONS = {}
+
+
+def _freeze_options(defaults, options):
+    """Gives shared, read-only defaults updated with the given options."""
+    merged = dict(defaults, **options)
+    try:
+        key = tuple(sorted(merged.items()))
+        return _FROZEN_OPTIONS.setdefault(key, MappingProxyType(merged))
+    # settings which cannot be hashed are not shared
+    except TypeError:
+        return MappingProxyType(merged)
+
+
+def _apply_method(job):
+    """Builds a text and runs one of its methods, in a worker process."""
+    cls, text, options, method_name, args, kwargs = job
+    return getattr(cls(text, options), method_name)(*args, **kwargs)
 
 
 class BaseText(UserString):
@@ -25,14 +128,28 @@ class BaseText(UserString):
         'encoding': 'utf-8',
         'language': 'english'
     }
-
-    def __init__(self, text, *args, **kwargs):
-        super().__init__(str)
-        # update .options if options keyword arg passed
-        if 'options' in kwargs:
-            if type(kwargs['options']) == dict:
-                self.options.update(kwargs['options'])
+    # set True to strip editorial marks with google's re2 engine (the re2
+    # module must be installed), linear time even on unclosed brackets
+    _use_re2 = False
+
+    def __init__(self, text, options=None):
+        # stores the text as given, which is not always a str, e.g.
+        # .lemmatize(return_string=False) gives a text holding a list
+        super().__init__('')
         self.data = text
+        # the class defaults, with any overrides merged in, become a
+        # read-only copy shared with every other text with the same settings,
+        # which new texts made by the text methods then reuse as they are
+        if isinstance(options, MappingProxyType):
+            self.options = options
+        elif isinstance(options, dict):
+            self.options = _freeze_options(type(self).options, options)
+        else:
+            self.options = _freeze_options(type(self).options, {})
+
+    def __reduce__(self):
+        # read-only options cannot be pickled, so are passed on as a dict
+        return self.__class__, (self.data, dict(self.options))
 
     def __enter__(self):
         pass
@@ -72,14 +189,8 @@ class BaseText(UserString):
             >>> print(modified_text)
             'Lorem ipsum dolor sit amet...'
         """
-        rexr = re.compile(r'\n+')
-        # substituting single endlines for matching endline blocks
-        clean_text = rexr.sub(' ', self.data)
         return self.__class__(
-            clean_text
-            .replace('-\n ', '').replace('- \n', '').replace('-\n', '')
-            .replace(' - ', '').replace('- ', '').replace(' -', '')
-            .replace('\n', ' '),
+            _rm_lines(self.data),
             self.options
         )
 
@@ -99,12 +210,8 @@ class BaseText(UserString):
             >>> print(modified_text)
             'Lorem ipsum dolor sit amet...'
         """ # noqa
-        if self.options['language'] == 'greek':
-            valid_chars_pattern = '([ʹ-Ϋά-ϡἀ-ᾯᾰ-῾ ])'
-        else:
-            valid_chars_pattern = '([A-Za-z ])'
         return self.__class__(
-            "".join(re.findall(valid_chars_pattern, self.data)),
+            _rm_nonchars(self.data, self.options['language']),
             self.options
         )
 
@@ -112,7 +219,11 @@ class BaseText(UserString):
         """Removes text inside editor's marks.
 
         Gives a new version with any text between editorial marks such as
-        brackets or parentheses removed.
+        brackets or parentheses removed. Marks are found in one pass from
+        left to right, so where marks of different kinds overlap, the mark
+        opened first wins and the other's opening mark goes with it, e.g.
+        'a(b[c)d]e' gives 'ad]e'. Up to 0.0.5 one kind of mark was removed
+        at a time, square brackets first, which gave 'a(be' instead.
 
         Returns:
             :obj:`self.__class__` Returns new version of text, with editoria removed
@@ -124,9 +235,7 @@ class BaseText(UserString):
             'Lor psum r sit a...'
         """ # noqa
         return self.__class__(
-            re.sub("\〚(.*?)\〛", "", re.sub("\{(.*?)\}", "", re.sub(
-                "\((.*?)\)", "", re.sub("\<(.*?)\>", "", re.sub(
-                    "\[(.*?)\]", "", self.data))))),
+            _rm_edits(self.data, self._use_re2),
             self.options
         )
 
@@ -144,15 +253,124 @@ class BaseText(UserString):
             >>> print(modified_text)
             'Lorem ipsum dolor sit amet...'
         """ # noqa
-        # regex compiler for all whitespace blocks
-        rexr = re.compile(r'\s+')
-        # substituting single spaces for matching whitespace blocks
-        clean_text = rexr.sub(' ', self.data)
         return self.__class__(
-            clean_text.strip(),
+            _rm_spaces(self.data),
+            self.options
+        )
+
+    def clean(self, lines=True, edits=True, spaces=True, nonchars=False):
+        """Performs several cleaning operations at once.
+
+        Gives the same result as chaining .rm_lines(), .rm_edits(),
+        .rm_nonchars(), and .rm_spaces() (in that order), but works on the
+        bare string throughout and only builds one new text object. Preferred
+        when cleaning many texts in bulk.
+
+        Args:
+            lines (:obj:`bool`, optional) True to remove endlines, as with .rm_lines()
+            edits (:obj:`bool`, optional) True to remove editorial marks, as with .rm_edits()
+            spaces (:obj:`bool`, optional) True to collapse whitespace, as with .rm_spaces()
+            nonchars (:obj:`bool`, optional) True to remove non-letters, as with .rm_nonchars()
+
+        Returns:
+            :obj:`self.__class__` New version of text, cleaned
+
+        Example:
+            >>> text = BaseText('Lorem  [ipsum] do-\\nlor sit amet')
+            >>> print(text.clean())
+            'Lorem dolor sit amet'
+        """ # noqa
+        return self.__class__(
+            _clean(
+                self.data, self.options['language'],
+                lines, edits, spaces, nonchars, self._use_re2
+            ),
             self.options
         )
 
+    @classmethod
+    def pipe(
+        cls, texts, lines=True, edits=True, spaces=True, nonchars=False,
+        options=None
+    ):
+        """Cleans a stream of texts lazily.
+
+        Takes any iterable of strings (e.g. lines of a file, or a generator
+        over a folder) and yields a cleaned text object for each, as with
+        .clean(), without building any intermediate text objects. Only one
+        text is held in memory at a time.
+
+        Args:
+            texts (:obj:`iterable` of :obj:`str`) Texts (strings or text objects) to clean
+            lines (:obj:`bool`, optional) True to remove endlines, as with .rm_lines()
+            edits (:obj:`bool`, optional) True to remove editorial marks, as with .rm_edits()
+            spaces (:obj:`bool`, optional) True to collapse whitespace, as with .rm_spaces()
+            nonchars (:obj:`bool`, optional) True to remove non-letters, as with .rm_nonchars()
+            options (:obj:`dict`, optional) Options settings for each new text
+
+        Yields:
+            :obj:`cls` Cleaned version of each text
+
+        Example:
+            >>> texts = ['Lorem  [ipsum]', 'dolor\\nsit amet']
+            >>> print(list(BaseText.pipe(texts)))
+            ['Lorem', 'dolor sit amet']
+        """ # noqa
+        language = (options or cls.options).get(
+            'language', cls.options['language']
+        )
+        for text in texts:
+            yield cls(
+                _clean(
+                    str(text), language, lines, edits, spaces, nonchars,
+                    cls._use_re2
+                ),
+                options
+            )
+
+    @classmethod
+    def map_parallel(
+        cls, texts, method_name, *args, workers=None, options=None, **kwargs
+    ):
+        """Runs a method on many texts at once, using several processes.
+
+        Builds a text object for each string and calls the named method on it,
+        spreading the work across a pool of processes. Worth it for methods
+        which do a lot of work per text, such as .normalize() or .lemmatize(),
+        over a large corpus; for quick methods the cost of sending texts to
+        the processes outweighs the gain. Any further arguments are passed on
+        to the method.
+
+        Args:
+            texts (:obj:`iterable` of :obj:`str`) Texts (strings or text objects) to process
+            method_name (:obj:`str`) Name of the method to call on each text
+            workers (:obj:`int`, optional) Number of processes, defaults to one per cpu
+            options (:obj:`dict`, optional) Options settings for each text
+
+        Returns:
+            :obj:`list` Result of the method for each text, in order
+
+        Example:
+            >>> texts = ['Lorem   ipsum', 'dolor  sit amet']
+            >>> print(BaseText.map_parallel(texts, 'rm_spaces'))
+            ['Lorem ipsum', 'dolor sit amet']
+        """ # noqa
+        texts = list(texts)
+        workers = workers or os.cpu_count() or 1
+        # several texts per task, so each process is not sent one at a time
+        chunksize = max(1, len(texts) // (workers * 4))
+        # read-only options cannot be pickled, so are sent on as a dict
+        if options is not None:
+            options = dict(options)
+        jobs = (
+            (cls, str(text), options, method_name, args, kwargs)
+            for text in texts
+        )
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(_apply_method, jobs, chunksize=chunksize)
+            )
+
     def re_search(self, pattern):
         """Search text for matching pattern.
 
@@ -173,9 +391,28 @@ class BaseText(UserString):
             >>> print(text.re_search('Arma virumque cano'))
             False
         """ # noqa
-        # Converting pattern to regex
-        pattern = re.compile(pattern)
-        if pattern.search(self.data):
-            return True
-        else:
-            return False
+        # compiled patterns are cached for repeated searches
+        return _compile(pattern).search(self.data) is not None
+
+    @classmethod
+    def re_search_many(cls, texts, pattern):
+        """Searches many texts for a matching pattern.
+
+        Gives the same results as calling .re_search() on each text, but
+        compiles the pattern once and skips building a text object for each.
+        Useful for filtering a corpus.
+
+        Args:
+            texts (:obj:`iterable` of :obj:`str`) Texts (strings or text objects) to search
+            pattern (:obj:`str`) String with the desired Regular Expression to search
+
+        Returns:
+            :obj:`list` of :obj:`bool` True for each text matching, False if not
+
+        Example:
+            >>> texts = ['Lorem ipsum dolor sit amet...', 'Arma virumque cano']
+            >>> print(BaseText.re_search_many(texts, 'Lorem'))
+            [True, False]
+        """ # noqa
+        search = _compile(pattern).search
+        return [search(str(text)) is not None for text in texts]
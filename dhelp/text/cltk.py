@@ -1,10 +1,206 @@
 #!/usr/bin/python
 
 import importlib
-import pip
+import importlib.util
+import os
+import re
+import subprocess
+import sys
+import threading
+import unicodedata
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from ._bases import BaseText
-from .nltk import NLTKMixin
+from .nltk import NLTKMixin, PUNKT_TOKENIZER, build_stopset
+
+
+# the passes of cltk's tlg_plaintext_cleanup, compiled once: marks, latin
+# letters and numbers, and '{...}', '(...)' spans are dropped first, then
+# punctuation (which cltk strips one character at a time), and whitespace
+_TLG_REMOVE_RE = re.compile(
+    r'-\n|«|»|<|>|\.\.\.|‘|’|_|\{.+?\}|\(.+?\)|[a-zA-Z0-9]'
+)
+_TLG_PUNCTUATION = str.maketrans('', '', ',·:"\'?-!*[]{}')
+_TLG_PUNCTUATION_PERIODS = str.maketrans('', '', ',·:"\'?-!*[]{}.;')
+_TLG_SPACES_RE = re.compile(r'\s+')
+
+# punctuation cltk's Frequency drops before counting words
+_FREQUENCY_PUNCTUATION = str.maketrans('', '', ',.;:"\'?-!*[]{}')
+
+
+@lru_cache(maxsize=None)
+def _cltk_symbol(dotted_path):
+    """Imports a cltk function or class on first use, later calls reuse it.
+
+    cltk is imported lazily, as it is only installed by .setup().
+    """
+    module, name = dotted_path.rsplit('.', 1)
+    return getattr(importlib.import_module(module), name)
+
+
+@lru_cache(maxsize=None)
+def _get_pos_tagger(language):
+    """Gives a shared cltk POSTag, which loads its taggers from disk."""
+    return _cltk_symbol('cltk.tag.pos.POSTag')(language)
+
+
+@lru_cache(maxsize=None)
+def _get_lemma_replacer(language):
+    """Gives a shared cltk LemmaReplacer, which loads its lemmata models."""
+    return _cltk_symbol('cltk.stem.lemma.LemmaReplacer')(language)
+
+
+@lru_cache(maxsize=None)
+def _get_sentence_tokenizer(language):
+    """Gives a shared cltk TokenizeSentence, which loads its punkt model."""
+    return _cltk_symbol('cltk.tokenize.sentence.TokenizeSentence')(language)
+
+
+@lru_cache(maxsize=None)
+def _get_macronizer(tagger):
+    """Gives a shared cltk Macronizer, which loads its macron table."""
+    return _cltk_symbol('cltk.prosody.latin.macronizer.Macronizer')(tagger)
+
+
+@lru_cache(maxsize=None)
+def _get_stemmer():
+    """Gives a shared cltk Latin Stemmer."""
+    return _cltk_symbol('cltk.stem.latin.stem.Stemmer')()
+
+
+@lru_cache(maxsize=None)
+def _get_jv_replacer():
+    """Gives a shared cltk JVReplacer, which compiles its patterns."""
+    return _cltk_symbol('cltk.stem.latin.j_v.JVReplacer')()
+
+
+def _cltk_tokenize(text, language, mode):
+    """Tokenizes a string with cltk's shared tokenizers."""
+    if mode == 'sentence':
+        return _get_sentence_tokenizer(language).tokenize_sentences(text)
+    return _cltk_symbol('cltk.tokenize.word.nltk_tokenize_words')(text)
+
+
+def _cltk_lemmatize(text, language, return_string, return_raw):
+    """Lemmatizes a string with cltk's shared lemmatizer."""
+    return _get_lemma_replacer(language).lemmatize(
+        text,
+        return_string=return_string,
+        return_raw=return_raw
+    )
+
+
+def _cltk_entities(text, language):
+    """Gives the entities cltk finds in a string."""
+    # keeping only items flagged as entity in tuple[1], non-entities are
+    # 1-tuples
+    return [
+        result[0] for result in _cltk_symbol('cltk.tag.ner.tag_ner')(
+            language,
+            input_text=text,
+            output_type=list
+        )
+        if len(result) > 1 and result[1] == 'Entity'
+    ]
+
+
+@lru_cache(maxsize=None)
+def _cltk_stopset(language):
+    """Gives cltk's stopwords for a language as a set, built once."""
+    return build_stopset(tuple(
+        _cltk_symbol('cltk.stop.' + language + '.stops.STOPS_LIST')
+    ))
+
+
+def _long_substring(text_a, text_b):
+    """Finds the longest substring of text_a also found in text_b.
+
+    Gives the same result as cltk's long_substring (the earliest such
+    substring in text_a, stripped), in linear rather than cubic time, using
+    a suffix automaton of text_b.
+    """
+    # suffix automaton of text_b: per state, its transitions, suffix link
+    # and length of the longest string it accepts
+    transitions = [{}]
+    links = [-1]
+    lengths = [0]
+    last = 0
+    for char in text_b:
+        state = len(lengths)
+        transitions.append({})
+        links.append(0)
+        lengths.append(lengths[last] + 1)
+        previous = last
+        while previous != -1 and char not in transitions[previous]:
+            transitions[previous][char] = state
+            previous = links[previous]
+        if previous != -1:
+            following = transitions[previous][char]
+            if lengths[previous] + 1 == lengths[following]:
+                links[state] = following
+            else:
+                clone = len(lengths)
+                transitions.append(dict(transitions[following]))
+                links.append(links[following])
+                lengths.append(lengths[previous] + 1)
+                while (
+                    previous != -1 and
+                    transitions[previous].get(char) == following
+                ):
+                    transitions[previous][char] = clone
+                    previous = links[previous]
+                links[following] = links[state] = clone
+        last = state
+    # walks text_a through it, tracking the longest match ending at each
+    # character, keeping the first (earliest starting) of the longest
+    state = length = best_length = best_end = 0
+    for end, char in enumerate(text_a):
+        while state and char not in transitions[state]:
+            state = links[state]
+            length = lengths[state]
+        if char in transitions[state]:
+            state = transitions[state][char]
+            length += 1
+        if length > best_length:
+            best_length, best_end = length, end + 1
+    return text_a[best_end - best_length:best_end].strip()
+
+
+@lru_cache(maxsize=8)
+def _shingles(text):
+    """Gives the set of 3-character shingles of a string.
+
+    Only the last few strings are kept, enough for one text compared
+    against others in turn, without holding on to a whole corpus.
+    """
+    return frozenset(text[i:i + 3] for i in range(len(text) - 2))
+
+
+def _jaccard(shingles_a, shingles_b):
+    """Gives the Jaccard similarity of two shingle sets, as cltk's minhash."""
+    shared = len(shingles_a & shingles_b)
+    total = len(shingles_a) + len(shingles_b) - shared
+    # texts too short for any shingles score 0.0, as in cltk
+    if not total:
+        return 0.0
+    return shared / float(total)
+
+
+def _is_normalized(text):
+    """Unicode quick check for text cltk_normalize (NFKC) would not change.
+
+    Always False on Python versions without unicodedata.is_normalized (<3.8).
+    """
+    if hasattr(unicodedata, 'is_normalized'):
+        return unicodedata.is_normalized('NFKC', text)
+    return False
+
+
+def _cltk_normalize(text):
+    """Runs cltk_normalize, looked up in cltk just the once."""
+    return _cltk_symbol('cltk.corpus.utils.formatter.cltk_normalize')(text)
 
 
 class CLTKMixin(NLTKMixin):
@@ -27,24 +223,73 @@ class CLTKMixin(NLTKMixin):
             >>> LatinText('').setup()
         """
         # check if cltk is already installed, if not, install it
-        if not importlib.find_loader('cltk'):
-            pip.main(['install', 'cltk'])
+        if importlib.util.find_spec('cltk') is None:
+            subprocess.check_call(
+                [sys.executable, '-m', 'pip', 'install', 'cltk']
+            )
+            importlib.invalidate_caches()
         # include cltk inline
-        from cltk.corpus.utils.importer import CorpusImporter
+        from cltk.corpus.utils.importer import CorpusImporter, CLTK_DATA_DIR
+        from git import GitCommandError
         setup_language = self.options['language']
         # for ancient greek, change to 'greek' for purposes of cltk setup
         if setup_language == 'ancient greek':
             setup_language = 'greek'
         corpus_importer = CorpusImporter(setup_language)
-        # loop through, check if extant, attempt to download, skip any errors
-        for cltk_corpus in corpus_importer.list_corpora:
-            print('Downloading', cltk_corpus)
+        # cltk creates each corpus type's folder without checking if another
+        # download just did, so they are all made here before downloading
+        for corpus in corpus_importer.all_corpora:
+            os.makedirs(os.path.expanduser(os.path.join(
+                CLTK_DATA_DIR, corpus_importer.language, corpus['type']
+            )), exist_ok=True)
+        # keeps messages from downloads running at once from interleaving
+        print_lock = threading.Lock()
+
+        # check if extant, attempt to download, giving back any failures
+        # worth retrying (network, git and file errors), skipping the rest
+        def import_corpus(cltk_corpus):
+            with print_lock:
+                print('Downloading', cltk_corpus)
+            try:
+                corpus_importer.import_corpus(cltk_corpus)
+            except (OSError, GitCommandError):
+                return cltk_corpus
+            except Exception:
+                with print_lock:
+                    print('Problem downloading', cltk_corpus, '(skipping)')
+        # downloads wait on the network, so several are run at once, each
+        # with its own git process (the shared importer is only read from)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            failed_corpora = [
+                cltk_corpus for cltk_corpus in executor.map(
+                    import_corpus, corpus_importer.list_corpora
+                )
+                if cltk_corpus is not None
+            ]
+        # those are tried once more, one at a time, skipping any errors
+        for cltk_corpus in failed_corpora:
+            print('Retrying', cltk_corpus)
             try:
                 corpus_importer.import_corpus(cltk_corpus)
-            except:
+            except Exception:
                 print('Problem downloading', cltk_corpus, '(skipping)')
         return True
 
+    @classmethod
+    def warmup(cls):
+        """Loads the cltk sentence tokenizer and lemmatizer ahead of use.
+
+        Overrides NLTK's warmup, loading the shared cltk models for the
+        class's language instead, so the first text processed is not slowed
+        down by reading them from disk. Requires the corpora from .setup().
+
+        Example:
+            >>> LatinText.warmup()
+        """
+        _get_sentence_tokenizer(cls.options['language'])
+        _get_lemma_replacer(cls.options['language'])
+        return True
+
     def tokenize(self, mode='word'):
         """Tokenizes the passage into lists of words or sentences.
 
@@ -62,14 +307,15 @@ class CLTKMixin(NLTKMixin):
             ['Gallia', 'est', 'omnis', 'divisa', 'in', 'partes', 'tres']
 
         """
-        from cltk.tokenize.word import nltk_tokenize_words
-        from cltk.tokenize.sentence import TokenizeSentence
-        if mode == 'sentence':
-            return TokenizeSentence(
-                self.options['language']
-            ).tokenize_sentences(self.data)
-        else:
-            return nltk_tokenize_words(self.data)
+        if mode != 'sentence':
+            mode = 'word'
+        return self._memoized(('tokenize', mode), lambda: _cltk_tokenize(
+            self.data, self.options['language'], mode
+        ))
+
+    def _default_stopset(self):
+        """Gives cltk's standard stopwords for the text's language."""
+        return _cltk_stopset(self.options['language'])
 
     def lemmatize(self, return_string=True, return_raw=False):
         """Transforms words into their lemmata.
@@ -86,18 +332,59 @@ class CLTKMixin(NLTKMixin):
             >>> print(text.lemmatize())
             gallia edo1 omne divido in pars tres
         """ # noqa
-        from cltk.stem.lemma import LemmaReplacer
         return self.__class__(
-            text=LemmaReplacer(
-                self.options['language']
-            ).lemmatize(
+            text=_cltk_lemmatize(
                 self.data.lower(),
-                return_string=return_string,
-                return_raw=return_raw
+                self.options['language'],
+                return_string,
+                return_raw
             ),
             options=self.options
         )
 
+    @classmethod
+    def lemmatize_many(
+        cls, texts, return_string=True, return_raw=False, options=None
+    ):
+        """Lemmatizes many texts in one go.
+
+        Gives the same results as calling .lemmatize() on each text, with the
+        same arguments, but builds no intermediate text objects. A text
+        appearing more than once is only lemmatized once.
+
+        Args:
+            texts (:obj:`iterable` of :obj:`str`) Texts to lemmatize
+            return_string (:obj:`bool`, optional) False to give each text's lemmata as a list, as with .lemmatize()
+            return_raw (:obj:`bool`, optional) True to keep each word with its lemma, as with .lemmatize()
+            options (:obj:`dict`, optional) Options settings for each new text
+
+        Returns:
+            :obj:`list` of :obj:`cls` Lemmatized version of each text
+
+        Example:
+            >>> texts = ['Gallia est omnis divisa', 'in partes tres']
+            >>> print(LatinText.lemmatize_many(texts))
+            ['gallia edo1 omne divido', 'in pars tres']
+        """ # noqa
+        language = (options or cls.options).get(
+            'language', cls.options['language']
+        )
+        # each distinct text is lemmatized once, for this batch only
+        lemmata = {}
+        lemmatized_texts = []
+        for text in texts:
+            text = str(text).lower()
+            if text not in lemmata:
+                lemmata[text] = _cltk_lemmatize(
+                    text, language, return_string, return_raw
+                )
+            # repeated texts each get their own copy of a list of lemmata
+            if isinstance(lemmata[text], list):
+                lemmatized_texts.append(cls(list(lemmata[text]), options))
+            else:
+                lemmatized_texts.append(cls(lemmata[text], options))
+        return lemmatized_texts
+
     # TODO: This function does not work for Greek currently
     def scansion(self):
         """Gives list of scanned feet.
@@ -115,10 +402,10 @@ class CLTKMixin(NLTKMixin):
             ['¯˘˘¯˘˘˘˘˘¯˘˘˘˘˘x']
         """ # noqa
         if self.options['language'] == 'greek':
-            from cltk.prosody.greek.scanner import Scansion as GreekScansion
+            GreekScansion = _cltk_symbol('cltk.prosody.greek.scanner.Scansion')
             return GreekScansion().scan_text(self.data)
         elif self.options['language'] == 'latin':
-            from cltk.prosody.latin.scanner import Scansion as LatinScansion
+            LatinScansion = _cltk_symbol('cltk.prosody.latin.scanner.Scansion')
             return LatinScansion().scan_text(self.data)
 
     def entities(self, lemmatize=False, unique=False):
@@ -138,28 +425,18 @@ class CLTKMixin(NLTKMixin):
             >>> print(text.entities())
             ['Gallia']
         """ # noqa
-        from cltk.stem.lemma import LemmaReplacer
-        from cltk.tag import ner
-        entity_list = []
-        # filtering non-entities
-        for result in ner.tag_ner(
-            self.options['language'],
-            input_text=self.data,
-            output_type=list
-        ):
-            # appending if item flagged as entity in tuple[1]
-            try:
-                if result[1] == 'Entity':
-                    entity_list.append(result[0])
-            # do nothing if 'Entity' not specified
-            except:
-                pass
-            # removing duplicate entities if unique option specified
+        entity_list = self._memoized(('entities',), lambda: _cltk_entities(
+            self.data, self.options['language']
+        ))
+        # removing duplicate entities if unique option specified, keeping
+        # the order they first appear in
         if unique:
-            entity_list = list(set(entity_list))
+            entity_list = list(dict.fromkeys(entity_list))
         # lemmatizing entities if option has been specified
         if lemmatize:
-            entity_list = LemmaReplacer(self.options['language']).lemmatize(
+            entity_list = _get_lemma_replacer(
+                self.options['language']
+            ).lemmatize(
                 entity_list,
                 return_string=False,
                 return_raw=False
@@ -197,12 +474,16 @@ class CLTKMixin(NLTKMixin):
             >>> print(text.compare_longest_common_substring('Galliae sunt omnis divisae in partes tres'))
             in partes tres
         """ # noqa
-        from cltk.text_reuse.comparison import long_substring
-        return long_substring(self.data, other_text)
+        return _long_substring(self.data, other_text)
 
     def compare_minhash(self, other_text):
         """Gives the minimum hash between this and any passed text.
 
+        Gives the same score as cltk's minhash, the exact Jaccard similarity
+        of the two texts' 3-character shingles. The shingles of each text are
+        kept for reuse, so comparing one text against many others only
+        shingles it once.
+
         Args:
             other_text (:obj:`str`) String for comparison
 
@@ -214,15 +495,38 @@ class CLTKMixin(NLTKMixin):
             >>> print(text.compare_minhash('Galliae sunt omnis divisae in partes tres'))
             0.6444444444444445
         """ # noqa
-        from cltk.text_reuse.comparison import minhash
-        return minhash(self.data, other_text)
+        return _jaccard(_shingles(self.data), _shingles(str(other_text)))
+
+    def compare_minhash_many(self, other_texts):
+        """Gives the minimum hash between this and each of many texts.
+
+        Gives the same scores as calling .compare_minhash() on each text,
+        but fetches this text's shingles once for the whole batch.
+
+        Args:
+            other_texts (:obj:`iterable` of :obj:`str`) Strings for comparison
+
+        Returns:
+            :obj:`list` of :obj:`float` Minimum hash against each text
+
+        Example:
+            >>> text = LatinText('Gallia est omnis divisa in partes tres')
+            >>> print(text.compare_minhash_many(['Galliae sunt omnis divisae in partes tres']))
+            [0.6444444444444445]
+        """ # noqa
+        shingles = _shingles(self.data)
+        return [
+            _jaccard(shingles, _shingles(str(other_text)))
+            for other_text in other_texts
+        ]
 
     def word_count(self, word=None):
         """Returns counter dictionary with word counts at respective keywords.
 
         Performs word counts and then stores their values in the respective
         keyword of a counter dictionary. If a word is passed, a simple integer
-        count of the number of appearances is returned.
+        count of the number of appearances is returned. Counts words as cltk's
+        Frequency.counter_from_str does, with punctuation removed.
 
         Args:
             word (:obj:`string`, optional) A single word you want to count
@@ -235,12 +539,13 @@ class CLTKMixin(NLTKMixin):
             >>> print(text.word_count(word='tres'))
             3
         """ # noqa
-        from cltk.utils.frequency import Frequency
-        counts = Frequency().counter_from_str(self.data)
-        # If a single word was specified, only return that frequency
+        tokens = PUNKT_TOKENIZER.word_tokenize(
+            self.data.translate(_FREQUENCY_PUNCTUATION)
+        )
+        # If a single word was specified, only count that word
         if word:
-            return counts[word]
-        return counts
+            return tokens.count(word)
+        return Counter(tokens)
 
 
 class LatinText(CLTKMixin, BaseText):
@@ -280,7 +585,6 @@ class LatinText(CLTKMixin, BaseText):
             >>> print(text.macronize())
             arma virumque cano , trojae quī prīmus ab ōrīs
         """ # noqa
-        from cltk.prosody.latin.macronizer import Macronizer
         mode = mode.lower()
         if (
             mode != 'tag_ngram_123_backoff' and
@@ -289,7 +593,7 @@ class LatinText(CLTKMixin, BaseText):
         ):
             return False
         return self.__class__(
-            Macronizer(tagger=mode).macronize_text(self.data),
+            _get_macronizer(mode).macronize_text(self.data),
             self.options
         )
 
@@ -309,9 +613,8 @@ class LatinText(CLTKMixin, BaseText):
             >>> print(text.normalize())
             Arma uirumque cano, Troiae qui primus ab oris
         """ # noqa
-        from cltk.stem.latin.j_v import JVReplacer
         return self.__class__(
-            JVReplacer().replace(self.data),
+            _get_jv_replacer().replace(self.data),
             self.options
         )
 
@@ -329,9 +632,8 @@ class LatinText(CLTKMixin, BaseText):
             >>> print(text.stemmify())
             arm vir cano, troi qui prim ab or
         """ # noqa
-        from cltk.stem.latin.stem import Stemmer
         return self.__class__(
-            Stemmer().stem(self.data.lower()),
+            _get_stemmer().stem(self.data.lower()),
             self.options
         )
 
@@ -349,7 +651,9 @@ class LatinText(CLTKMixin, BaseText):
             >>> print(text.clausulae())
             {'cretic + trochee': 0, '4th paeon + trochee': 0, '1st paeon + trochee': 0, 'substituted cretic + trochee': 0, '1st paeon + anapest': 0, 'double cretic': 0, '4th paeon + cretic': 0, 'molossus + cretic': 0, 'double trochee': 0, 'molossus + double trochee': 0, 'cretic + double trochee': 0, 'dactyl + double trochee': 0, 'choriamb + double trochee': 0, 'cretic + iamb': 0, 'molossus + iamb': 0, 'double spondee': 0, 'cretic + double spondee': 0, 'heroic': 0}
         """ # noqa
-        from cltk.prosody.latin.clausulae_analysis import Clausulae
+        Clausulae = _cltk_symbol(
+            'cltk.prosody.latin.clausulae_analysis.Clausulae'
+        )
         return Clausulae().clausulae_analysis(self.data)
 
 
@@ -371,12 +675,19 @@ class AncientGreekText(CLTKMixin, BaseText):
         'language': 'greek'
     }
 
-    def normalize(self):
+    def normalize(self, form='cltk'):
         """Fixes problems with differences in greek accent encoding.
 
         Certain Greek accents have more than one possible encoding. Uses cltk's
         built-in normalizer to correct the character encoding differences and
-        ensure that accents are encoded the same way.
+        ensure that accents are encoded the same way. A specific unicode
+        normal form can be requested instead. The compatibility forms ('NFKC',
+        'NFKD') are lossy, folding ligatures and the like into their plain
+        equivalents, but leave fewer spelling variants for later tagging and
+        lexicon lookups.
+
+        Args:
+            form (:obj:`str`, optional) 'cltk' for cltk's normalizer, or a unicode normal form, 'NFC', 'NFKC', 'NFD', or 'NFKD'
 
         Returns:
             :obj:`self.__class__` New instance with altered text
@@ -386,9 +697,15 @@ class AncientGreekText(CLTKMixin, BaseText):
             >>> print(text.normalize())
             ῖν», εἰς δὲ τὸν ἕτερον κ[α]ττίτ[ερον «εἰ λῶιον καὶ ἄμει]νόν ἐστι
         """ # noqa
-        from cltk.corpus.utils.formatter import cltk_normalize
+        text = self.data
+        if form == 'cltk':
+            # already normalized text, the common case, is returned as is
+            if not _is_normalized(text):
+                text = _cltk_normalize(text)
+        else:
+            text = unicodedata.normalize(form, text)
         return self.__class__(
-            text=cltk_normalize(str(self.data)),
+            text=text,
             options=self.options
         )
 
@@ -396,7 +713,8 @@ class AncientGreekText(CLTKMixin, BaseText):
         """Fix TLG betacode texts using TLGU.
 
         Necessary to cleanup TLG texts before processing, but can also used to
-        perform rudimentary cleaning operations on other Greek texts.
+        perform rudimentary cleaning operations on other Greek texts. Gives
+        the same results as cltk's tlg_plaintext_cleanup.
 
         Args:
             rm_punctuation (:obj:`bool`, optional) True to remove punctuation marks (exception periods)
@@ -410,11 +728,19 @@ class AncientGreekText(CLTKMixin, BaseText):
             >>> print(text.tlgu_cleanup())
             ῖν εἰς δὲ τὸν ἕτερον καττίτερον εἰ λῶιον καὶ ἄμεινόν ἐστι
         """ # noqa
-        from cltk.corpus.utils.formatter import tlg_plaintext_cleanup
+        # same steps as cltk's tlg_plaintext_cleanup, without its per
+        # character loop over the text
+        text = _TLG_REMOVE_RE.sub('', self.data)
+        if rm_punctuation:
+            if rm_periods:
+                stripped = text.translate(_TLG_PUNCTUATION_PERIODS)
+            else:
+                stripped = text.translate(_TLG_PUNCTUATION)
+            # as in cltk, text which is all punctuation is left as it is
+            if stripped:
+                text = stripped
         return self.__class__(
-            text=tlg_plaintext_cleanup(
-                self.data, rm_punctuation=rm_punctuation, rm_periods=rm_periods
-            ),
+            text=_TLG_SPACES_RE.sub(' ', text),
             options=self.options
         )
 
@@ -435,14 +761,14 @@ class AncientGreekText(CLTKMixin, BaseText):
             >>> print(text.tag())
             [('ἔστι', 'V3SPIA---'), ('δὲ', 'G--------'), ('σύμπαντα', None), ('ταῦτα', 'A-P---NA-'), ('τὰ', 'L-P---NA-'), ('συγγράμματα', None), ('ἐκείνῃ', 'A-S---FD-'), ('μάλιστα', 'D--------'), ('οὐκ', 'D--------'), ('ὠφέλιμα', None), (',', 'U--------'), ('ὅτι', 'C--------'), ('ὡς', 'C--------'), ('πρὸς', 'R--------'), ('εἰδότας', 'T-PRPAMA-'), ('συγγέγραπται', None), ('.', '---------')]
         """ # noqa
-        from cltk.tag.pos import POSTag
-        tagger = POSTag(self.options['language'])
+        tagger = _get_pos_tagger(self.options['language'])
+        tagging_methods = {
+            '123': tagger.tag_ngram_123_backoff,
+            'tnt': tagger.tag_tnt
+        }
         mode = mode.lower()
-        if mode != '123' and mode != 'tnt':
+        if mode not in tagging_methods:
             raise Exception(
                 'Invalid part of speech tagging mode specified.'
             )
-        elif mode == '123':
-            return tagger.tag_ngram_123_backoff(self.data)
-        elif mode == 'tnt':
-            return tagger.tag_tnt(self.data)
+        return tagging_methods[mode](self.data)
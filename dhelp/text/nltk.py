@@ -1,19 +1,92 @@
 #!/usr/bin/python
 
 import os
+from collections import Counter
+from functools import lru_cache
 
 import nltk
-from nltk.text import Text
 from nltk.tokenize.punkt import PunktLanguageVars
 from nltk.tokenize import sent_tokenize, word_tokenize, wordpunct_tokenize
-from nltk.util import ngrams, bigrams, trigrams, skipgrams
+from nltk.tokenize import RegexpTokenizer
+from nltk.util import skipgrams
 from nltk.stem.wordnet import WordNetLemmatizer
-from nltk import pos_tag
+from nltk.tag.perceptron import PerceptronTagger
+from nltk.corpus import stopwords
 
 from .. import settings
 from ._bases import BaseText
 
 
+# maps the first letter of a penn treebank tag to its wordnet part of speech
+_WORDNET_POS = {
+    'N': 'n',
+    'V': 'v',
+    'J': 'a',
+    'R': 'r'
+}
+
+
+# single regex pass splitting words from punctuation, used in place of the
+# sentence and treebank tokenizers when options['fast_tokenize'] is set
+_FAST_WORD_TOKENIZER = RegexpTokenizer(r'\w+|[^\w\s]')
+
+# tokenizer used for each tokenize() mode
+_TOKENIZERS = {
+    'sentence': sent_tokenize,
+    'wordpunct': wordpunct_tokenize,
+    'fast': _FAST_WORD_TOKENIZER.tokenize,
+    'word': word_tokenize
+}
+
+# shared word tokenizer for stopword removal and word counts, which needs no
+# model data, also used by the cltk texts
+PUNKT_TOKENIZER = PunktLanguageVars()
+
+
+@lru_cache(maxsize=32)
+def build_stopset(stoplist):
+    """Normalizes a tuple of stopwords into a set, once per stoplist."""
+    return frozenset(str(stopword).strip().lower() for stopword in stoplist)
+
+
+@lru_cache(maxsize=32)
+def _language_stopset(language):
+    """Loads nltk's stopwords for a language as a set, once per language."""
+    return build_stopset(tuple(stopwords.words(language)))
+
+
+def _tag_sentences(sentences):
+    """Tags tokenized sentences, giving one flat list of tagged words."""
+    tagger = _get_pos_tagger()
+    return [
+        tagged_word
+        for sentence in sentences
+        for tagged_word in tagger.tag(list(sentence))
+    ]
+
+
+@lru_cache(maxsize=None)
+def _get_pos_tagger():
+    """Gives a single shared PerceptronTagger, which loads its model once.
+
+    nltk's own pos_tag and pos_tag_sents (up to 3.8) load a new tagger on
+    every call.
+    """
+    return PerceptronTagger()
+
+
+@lru_cache(maxsize=None)
+def _get_lemmatizer():
+    """Gives a single shared WordNetLemmatizer."""
+    return WordNetLemmatizer()
+
+
+@lru_cache(maxsize=8192)
+def _cached_lemmatize(word, pos):
+    """Lemmatizes a lowercase word, memoized as most words repeat."""
+    return _get_lemmatizer().lemmatize(word, pos=pos)
+
+
 class NLTKMixin:
     """Mixin for NLTK-related functions.
 
@@ -53,18 +126,78 @@ class NLTKMixin:
                 nltk.data.find(package_path)
                 pass
             # if no file was found, download the respective package
-            except:
+            except LookupError:
                 nltk.download(package)
         return True
 
-    def rm_stopwords(self, stoplist=[]):
+    @classmethod
+    def warmup(cls):
+        """Loads the tokenizer and tagger models ahead of first use.
+
+        NLTK reads its models from disk the first time they are needed, so
+        the first text processed is noticeably slower than the rest. Call
+        once before processing (e.g. at program start) to pay that cost at
+        a predictable point instead. Requires the packages from .setup().
+
+        Example:
+            >>> EnglishText.warmup()
+        """
+        _get_pos_tagger().tag(word_tokenize(sent_tokenize('Lorem ipsum.')[0]))
+        return True
+
+    @classmethod
+    def tokenize_many(cls, texts, mode='word', workers=None, options=None):
+        """Tokenizes many texts at once, using several processes.
+
+        Gives the same result as calling .tokenize() on each text, but
+        spreads the work across processes with .map_parallel(). A text
+        appearing more than once in the batch is only tokenized once.
+
+        Args:
+            texts (:obj:`iterable` of :obj:`str`) Texts to tokenize
+            mode (:obj:`str`) Specifies tokenize mode, either 'word', 'sentence', 'wordpunct', or 'fast'
+            workers (:obj:`int`, optional) Number of processes, defaults to one per cpu
+            options (:obj:`dict`, optional) Options settings for each text
+
+        Returns:
+            :obj:`list` of :obj:`list` Tokens of each text, in order
+
+        Example:
+            >>> texts = ['Lorem ipsum.', 'Dolor sit amet.']
+            >>> print(EnglishText.tokenize_many(texts))
+            [['Lorem', 'ipsum', '.'], ['Dolor', 'sit', 'amet', '.']]
+        """ # noqa
+        texts = list(texts)
+        unique_texts = list(dict.fromkeys(texts))
+        tokens = dict(zip(unique_texts, cls.map_parallel(
+            unique_texts, 'tokenize', mode, workers=workers, options=options
+        )))
+        return [list(tokens[text]) for text in texts]
+
+    def _memoized(self, key, compute):
+        """Gives a result for this text, computing it only the first time.
+
+        Texts are never altered in place, so results such as tags can be kept
+        on the instance and reused when, say, .tag() and .lemmatize() are both
+        called. Each call gets its own copy of the list.
+        """
+        try:
+            results = self._results
+        except AttributeError:
+            results = self._results = {}
+        if key not in results:
+            results[key] = compute()
+        return list(results[key])
+
+    def rm_stopwords(self, stoplist=None):
         """Removes words or phrases from the text.
 
         Given a list of words or phrases, gives new text with those phrases
-        removed.
+        removed. If no list is given, the standard stopwords of the text's
+        language are removed, loaded once and then reused.
 
         Args:
-            stoplist (:obj:`list`) List of words or phrases to filter from text
+            stoplist (:obj:`list`, optional) List of words or phrases to filter from text, defaults to the language's stopwords
 
         Returns:
             :obj:`self.__class__` New version of text, with stop words/phrases removed
@@ -76,24 +209,29 @@ class NLTKMixin:
             >>> print(modified_text)
             'Lorem dolor amet...'
         """ # noqa
-        filtered_words = []
+        # normalized set of the stoplist, so each word needs one lookup,
+        # shared between calls with the same stoplist
+        if stoplist is None:
+            stopset = self._default_stopset()
+        else:
+            stopset = build_stopset(tuple(stoplist))
         # converts text to list of words with NLTK tokenizer
-        tokenizer = PunktLanguageVars()
-        tokens = tokenizer.word_tokenize(str(self.data))
-        # loop through each word, if not in stoplist, append
-        for word in tokens:
-            not_found = True
-            for stopword in stoplist:
-                if str(word).strip().lower() == str(stopword).strip().lower():
-                    not_found = False
-            if not_found:
-                filtered_words.append(word)
+        tokens = PUNKT_TOKENIZER.word_tokenize(self.data)
+        # keep each word not in stoplist
+        filtered_words = [
+            word for word in tokens
+            if str(word).strip().lower() not in stopset
+        ]
         # return rejoined word
         return self.__class__(
             " ".join(filtered_words),
             self.options
         )
 
+    def _default_stopset(self):
+        """Gives the set of standard stopwords for the text's language."""
+        return _language_stopset(self.options['language'])
+
     def lemmatize(self):
         """Transforms words into their lemmata.
 
@@ -111,15 +249,13 @@ class NLTKMixin:
         """ # noqa
         tagged_words = self.tag()
         lemmata = []
-        lemmatizer = WordNetLemmatizer()
         for word, parsing in tagged_words:
             # Grab main part of speech from first character in POS
-            pos = parsing[0]
-            try:
-                lemmatized_word = lemmatizer.lemmatize(
-                    word.lower(), pos=pos.lower()[0]
-                )
-            except:
+            wordnet_pos = _WORDNET_POS.get(parsing[0])
+            # words with no wordnet part of speech are left as they are
+            if wordnet_pos:
+                lemmatized_word = _cached_lemmatize(word.lower(), wordnet_pos)
+            else:
                 lemmatized_word = word
             lemmata.append(lemmatized_word)
         return self.__class__(
@@ -131,10 +267,13 @@ class NLTKMixin:
         """ Splits words (or sentences) into lists of strings
 
         Returns a tokenized list. By default returns list of words, but can
-        also return as a list of sentences.
+        also return as a list of sentences. In 'fast' mode, or if the text's
+        options have 'fast_tokenize' set, words are split with a single regex
+        instead, which is much quicker on large, already cleaned, texts but
+        does not treat contractions or abbreviations specially.
 
         Args:
-            mode (:obj:`str`) Specifies tokenize mode, either 'word', 'sentence', or 'wordpunct'
+            mode (:obj:`str`) Specifies tokenize mode, either 'word', 'sentence', 'wordpunct', or 'fast'
 
         Returns:
             :obj:`list` List of (string) tokens
@@ -146,21 +285,19 @@ class NLTKMixin:
             >>> print(EnglishText.tokenize(mode='sentence'))
             ['Lorem ipsum dolor sit amet.', 'Consectetur adipiscing elit.']
         """ # noqa
-        if mode == 'sentence':
-            return (
-                sent_tokenize(self.data)
-            )
-        elif mode == 'wordpunct':
-            return wordpunct_tokenize(self.data)
-        else:
-            return word_tokenize(self.data)
+        if mode not in ('sentence', 'wordpunct', 'fast'):
+            mode = 'fast' if self.options.get('fast_tokenize') else 'word'
+        return self._memoized(
+            ('tokenize', mode), lambda: _TOKENIZERS[mode](self.data)
+        )
 
     def tag(self):
         """Performs part-of-speech analysis on the text.
 
         Returns list of words marked up with parts of speech. Each word is
         returned as a 2-tuple, the first containing the word, the second with
-        the parts of speech.
+        the parts of speech. Sentences are tagged one by one, so the tagger
+        sees where each begins and ends.
 
         Returns:
             (:obj:`list`) Words tagged as 2-tuples (word|part of speech)
@@ -171,13 +308,67 @@ class NLTKMixin:
             >>> print(basic_tags)
             [('They', 'PRP'), ('hated', 'VBD'), ('to', 'TO'), ('think', 'VB'), ('of', 'IN'), ('sample', 'JJ'), ('sentences', 'NNS'), ('.', '.')]
         """ # noqa
-        word_list = list(self.tokenize())
-        return pos_tag(word_list)
+        def tag_sentences():
+            # words of each sentence split as .tokenize() splits the text
+            return _tag_sentences(
+                self.__class__(sentence, self.options).tokenize()
+                for sentence in self.tokenize(mode='sentence')
+            )
+        return self._memoized(('tag',), tag_sentences)
+
+    def iter_ngrams(self, gram_size=3):
+        """Gives ngrams one at a time.
+
+        Same as .ngrams(), but yields each ngram in turn instead of building
+        the whole list, for when ngrams are only looped over once.
+
+        Args:
+            gram_size (:obj:`int`, optional) Size of the ngrams to generate
+
+        Returns:
+            :obj:`iterator` of :obj:`tuple` Words of each ngram
+
+        Example:
+            >>> text = EnglishText('They hated to think of sample sentences.')
+            >>> for ngram in text.iter_ngrams():
+            ...     print(ngram)
+            ('They', 'hated', 'to')
+            ...
+        """ # noqa
+        if gram_size < 2:   # pragma: no cover
+            gram_size = 2
+        tokens = self.tokenize()
+        # zips the token list against itself offset by 1, 2, ... places, the
+        # same ngrams as nltk's but built in C rather than a generator loop
+        return zip(*(tokens[offset:] for offset in range(gram_size)))
+
+    def iter_skipgrams(self, gram_size=3, skip_size=1):
+        """Gives skipgrams one at a time.
+
+        Same as .skipgrams(), but yields each skipgram in turn instead of
+        building the whole list, which can grow very large for long texts.
+
+        Args:
+            gram_size (:obj:`int`, optional) Size of the ngrams to generate
+            skip_size (:obj:`int`, optional) Size of max spacing allowed
+
+        Returns:
+            :obj:`generator` of :obj:`tuple` Words of each skipgram
+
+        Example:
+            >>> text = EnglishText('They hated to think of sample sentences.')
+            >>> for skipgram in text.iter_skipgrams():
+            ...     print(skipgram)
+            ('They', 'hated', 'to')
+            ...
+        """ # noqa
+        return skipgrams(self.tokenize(), gram_size, skip_size)
 
     def ngrams(self, gram_size=3):
         """Gives ngrams.
 
-        Returns a list of ngrams, each ngram represented as a tuple.
+        Returns a list of ngrams, each ngram represented as a tuple. See
+        .iter_ngrams() to loop over them without building the list.
 
         Args:
             gram_size (:obj:`int`, optional) Size of the ngrams to generate
@@ -191,21 +382,14 @@ class NLTKMixin:
             >>> print(basic_ngrams)
             [('They', 'hated', 'to'), ('hated', 'to', 'think'), ('to', 'think', 'of'), ('think', 'of', 'sample'), ('of', 'sample', 'sentences'), ('sample', 'sentences', '.')]
         """ # noqa
-        tokens = self.tokenize()
-        if gram_size < 2:   # pragma: no cover
-            gram_size = 2
-        if gram_size == 2:  # pragma: no cover
-            return list(bigrams(tokens))
-        if gram_size == 3:
-            return list(trigrams(tokens))
-        else:   # pragma: no cover
-            return list(ngrams(tokens, gram_size))
+        return list(self.iter_ngrams(gram_size))
 
     def skipgrams(self, gram_size=3, skip_size=1):
         """Gives skipgrams.
 
         Returns list of skipgrams, similar to ngram, but allows spacing between
-        tokens.
+        tokens. See .iter_skipgrams() to loop over them without building the
+        list.
 
         Args:
             gram_size (:obj:`int`, optional) Size of the ngrams to generate
@@ -220,15 +404,15 @@ class NLTKMixin:
             >>> print(basic_skipgrams)
             [('They', 'hated', 'to'), ('They', 'hated', 'think'), ('They', 'to', 'think'), ('hated', 'to', 'think'), ('hated', 'to', 'of'), ('hated', 'think', 'of'), ('to', 'think', 'of'), ('to', 'think', 'sample'), ('to', 'of', 'sample'), ('think', 'of', 'sample'), ('think', 'of', 'sentences'), ('think', 'sample', 'sentences'), ('of', 'sample', 'sentences'), ('of', 'sample', '.'), ('of', 'sentences', '.'), ('sample', 'sentences', '.')] # noqa
         """
-        tokens = self.tokenize()
-        return list(skipgrams(tokens, gram_size, skip_size))
+        return list(self.iter_skipgrams(gram_size, skip_size))
 
     def word_count(self, word=None):
         """Returns counter dictionary with word counts at respective keywords.
 
         Performs word counts and then stores their values in the respective
         keyword of a counter dictionary. If a word is passed, a simple integer
-        count of the number of appearances is returned.
+        count of the number of appearances is returned (0 if it never
+        appears).
 
         Args:
             word (:obj:`string`, optional) A single word you want to count
@@ -239,11 +423,11 @@ class NLTKMixin:
         Example:
             >>> # TODO:
         """ # noqa
-        counts = dict(Text(self.tokenize()).vocab())
-        # If a single word was specified, only return that frequency
+        tokens = self.tokenize()
+        # If a single word was specified, only count that word
         if word:
-            return counts[word]
-        return counts
+            return tokens.count(word)
+        return Counter(tokens)
 
 
 class EnglishText(NLTKMixin, BaseText):
@@ -38,6 +38,13 @@ class TestAncientGreekText(unittest.TestCase):
         comparanda = 'ὑπὲρ ὁ υἱός χρυσίππου ὁ ἀντιφάνου'
         return self.assertEqual(exempla, comparanda)
 
+    def test_rm_stopwords(self):
+        # Should get text without cltk's greek stopwords
+        exempla = AncientGreekText('ὑπὲρ τοῦ υἱοῦ Χρυσίππου τοῦ Ἀντιφάνου')
+        exempla = exempla.rm_stopwords()
+        comparanda = 'υἱοῦ Χρυσίππου Ἀντιφάνου'
+        return self.assertEqual(exempla, comparanda)
+
     # TODO: Fix scansion
     # def test_scansion(self):
         # Should get type of string
@@ -87,6 +94,13 @@ class TestAncientGreekText(unittest.TestCase):
         comparanda = 'ῖν», εἰς δὲ τὸν ἕτερον κ[α]ττίτ[ερον'
         return self.assertEqual(exempla, comparanda)
 
+    def test_normalize_form(self):
+        # Should get decomposed text
+        exempla = AncientGreekText('ἕτερον')
+        exempla = exempla.normalize(form='NFD')
+        comparanda = 'ε\u0314\u0301τερον'
+        return self.assertEqual(exempla, comparanda)
+
     def test_tlgu_cleanup(self):
         # Should get type of string
         exempla = AncientGreekText(
@@ -96,6 +110,15 @@ class TestAncientGreekText(unittest.TestCase):
         comparanda = 'ῖν εἰς δὲ τὸν ἕτερον καττίτερον'
         return self.assertEqual(exempla, comparanda)
 
+    def test_tlgu_cleanup_periods(self):
+        # should drop periods, editorial spans, and latin characters too
+        exempla = AncientGreekText(
+            'εἰς δὲ (τὸν) ἕτερον. κα-\nττίτερον {εἰ} abc λῶιον;'
+        )
+        exempla = exempla.tlgu_cleanup(rm_periods=True)
+        comparanda = 'εἰς δὲ ἕτερον καττίτερον λῶιον'
+        return self.assertEqual(exempla, comparanda)
+
     def test_tag(self):
         # Should get type of string
         exempla = AncientGreekText(
@@ -2,7 +2,12 @@
 
 import unittest
 
-from ..nltk import EnglishText
+from ..nltk import EnglishText, _get_pos_tagger
+
+try:
+    import re2
+except ImportError:
+    re2 = None
 
 
 class EnglishSetupLayer:
@@ -12,6 +17,10 @@ class EnglishSetupLayer:
         EnglishText.setup()
 
 
+class RE2EnglishText(EnglishText):
+    _use_re2 = True
+
+
 class TestEnglishText(unittest.TestCase):
     layer = EnglishSetupLayer
 
@@ -22,6 +31,30 @@ class TestEnglishText(unittest.TestCase):
         comparanda = str
         return self.assertEqual(exempla, comparanda)
 
+    def test_options(self):
+        # options passed to one text should not leak into others
+        exempla = EnglishText("Lorem ipsum", options={'language': 'latin'})
+        comparanda = EnglishText("Lorem ipsum")
+        exempla = exempla.rm_lines()
+        self.assertEqual(exempla.options['language'], 'latin')
+        return self.assertEqual(comparanda.options['language'], 'english')
+
+    def test_options_shared(self):
+        # texts with the same options should share one read-only copy
+        exempla = EnglishText("Lorem ipsum", options={'language': 'latin'})
+        comparanda = EnglishText("dolor sit", options={'language': 'latin'})
+        self.assertIs(exempla.rm_spaces().options, comparanda.options)
+        with self.assertRaises(TypeError):
+            exempla.options['language'] = 'english'
+
+    def test_options_default(self):
+        # default options should be read-only, so they cannot leak either
+        exempla = EnglishText("Lorem ipsum")
+        with self.assertRaises(TypeError):
+            exempla.options['language'] = 'latin'
+        comparanda = EnglishText("dolor sit")
+        return self.assertEqual(comparanda.options['language'], 'english')
+
     def test_rm_lines(self):
         # should get version with endline replaced with space
         exempla = EnglishText("Lorem ipsum dolor\nsit amet")
@@ -29,6 +62,13 @@ class TestEnglishText(unittest.TestCase):
         exempla = exempla.rm_lines()
         return self.assertEqual(exempla, comparanda)
 
+    def test_rm_lines_dashed(self):
+        # words split by a dash at an endline should be rejoined
+        exempla = EnglishText("Lorem ipsum do-\n\nlor sit amet")
+        comparanda = EnglishText("Lorem ipsum dolor sit amet")
+        exempla = exempla.rm_lines()
+        return self.assertEqual(exempla, comparanda)
+
     def test_rm_nonchars(self):
         # numbers should be removed
         exempla = EnglishText("Lorem1 ipsum2 dolor3 sit4 amet5")
@@ -36,6 +76,13 @@ class TestEnglishText(unittest.TestCase):
         exempla = exempla.rm_nonchars()
         return self.assertEqual(exempla, comparanda)
 
+    def test_rm_nonchars_non_ascii(self):
+        # non-ascii letters should be removed along with numbers
+        exempla = EnglishText("Lorem1 ipsum2 dolor3 sit4 amet5 αβγ")
+        comparanda = EnglishText("Lorem ipsum dolor sit amet ")
+        exempla = exempla.rm_nonchars()
+        return self.assertEqual(exempla, comparanda)
+
     def test_rm_edits(self):
         # text between brackets should be removed
         exempla = EnglishText("Lorem ipsum [dolor] sit amet")
@@ -43,6 +90,55 @@ class TestEnglishText(unittest.TestCase):
         exempla = exempla.rm_edits()
         return self.assertEqual(exempla, comparanda)
 
+    def test_rm_edits_all_marks(self):
+        # text between every kind of editorial mark should be removed
+        exempla = EnglishText("Lore[m i]psum <do>l{o}r 〚sit〛 a(met)")
+        comparanda = EnglishText("Lorepsum lr  a")
+        exempla = exempla.rm_edits()
+        return self.assertEqual(exempla, comparanda)
+
+    def test_rm_edits_interleaved(self):
+        # the parenthesis is opened first, so wins, taking the '[' with it
+        exempla = EnglishText("a(b[c)d]e")
+        comparanda = EnglishText("ad]e")
+        exempla = exempla.rm_edits()
+        return self.assertEqual(exempla, comparanda)
+
+    def test_rm_edits_interleaved_reversed(self):
+        # the bracket is opened first, so wins, taking the '(' with it
+        exempla = EnglishText("a[b(c]d)e")
+        comparanda = EnglishText("ad)e")
+        exempla = exempla.rm_edits()
+        return self.assertEqual(exempla, comparanda)
+
+    def test_rm_edits_unclosed(self):
+        # the bracket is never closed, so is kept, the parentheses win
+        exempla = EnglishText("Lorem [ipsum (dolor) sit amet")
+        comparanda = EnglishText("Lorem [ipsum  sit amet")
+        exempla = exempla.rm_edits()
+        return self.assertEqual(exempla, comparanda)
+
+    @unittest.skipUnless(re2, 're2 is not installed')
+    def test_rm_edits_re2(self):
+        # re2 should remove the same text as the default engine
+        texts = [
+            "Lore[m i]psum <do>l{o}r 〚sit〛 a(met)",
+            "a(b[c)d]e",
+            "Lorem [ipsum\ndolor] sit (amet"
+        ]
+        exempla = [RE2EnglishText(text).rm_edits() for text in texts]
+        comparanda = [EnglishText(text).rm_edits() for text in texts]
+        return self.assertEqual(exempla, comparanda)
+
+    @unittest.skipUnless(re2, 're2 is not installed')
+    def test_re_search_re2(self):
+        # searches should match as they do with the default engine
+        text = "Lore[m i]psum dolor sit amet"
+        patterns = ['ipsum', r'\[m i\]', 'Arma']
+        exempla = [RE2EnglishText(text).re_search(p) for p in patterns]
+        comparanda = [EnglishText(text).re_search(p) for p in patterns]
+        return self.assertEqual(exempla, comparanda)
+
     def test_rm_spaces(self):
         # redundant spaces should be gone
         exempla = EnglishText("Lorem   ipsum          dolor   sit    amet")
@@ -50,6 +146,41 @@ class TestEnglishText(unittest.TestCase):
         exempla = exempla.rm_spaces()
         return self.assertEqual(exempla, comparanda)
 
+    def test_clean(self):
+        # should match chaining each cleaning method
+        exempla = EnglishText("Lorem1  [ipsum] do-\nlor\n\nsit   amet")
+        comparanda = exempla.rm_lines().rm_edits().rm_nonchars().rm_spaces()
+        exempla = exempla.clean(nonchars=True)
+        return self.assertEqual(exempla, comparanda)
+
+    def test_pipe(self):
+        # should clean every text passed
+        exempla = EnglishText.pipe(
+            ["Lorem  [ipsum]", EnglishText("dolor\nsit amet")]
+        )
+        comparanda = [EnglishText("Lorem"), EnglishText("dolor sit amet")]
+        exempla = list(exempla)
+        return self.assertEqual(exempla, comparanda)
+
+    def test_map_parallel(self):
+        # should give the method's result for every text passed
+        exempla = EnglishText.map_parallel(
+            ["Lorem   ipsum", EnglishText("dolor  sit amet")], 'rm_spaces',
+            workers=2
+        )
+        comparanda = [
+            EnglishText("Lorem ipsum"), EnglishText("dolor sit amet")
+        ]
+        return self.assertEqual(exempla, comparanda)
+
+    def test_map_parallel_options(self):
+        # a text's own read-only options should be passed on to each process
+        text = EnglishText("Lorem", options={'language': 'latin'})
+        exempla = EnglishText.map_parallel(
+            ["Lorem   ipsum"], 'rm_spaces', workers=2, options=text.options
+        )
+        return self.assertEqual(exempla[0].options, text.options)
+
     def test_rm_stopwords(self):
         # word in stopword list should be removed
         exempla = EnglishText("Lorem ipsum dolor sit amet")
@@ -57,6 +188,13 @@ class TestEnglishText(unittest.TestCase):
         exempla = exempla.rm_stopwords(['dolor'])
         return self.assertEqual(exempla, comparanda)
 
+    def test_rm_stopwords_default(self):
+        # standard english stopwords should be removed
+        exempla = EnglishText("The quick brown fox jumped over the lazy dog")
+        comparanda = EnglishText("quick brown fox jumped lazy dog")
+        exempla = exempla.rm_stopwords()
+        return self.assertEqual(exempla, comparanda)
+
     def test_re_search_present(self):
         # should be true as pattern is present
         exempla = EnglishText("Lorem ipsum dolor sit amet")
@@ -67,6 +205,22 @@ class TestEnglishText(unittest.TestCase):
         exempla = EnglishText("Lorem ipsum dolor sit amet")
         return self.assertFalse(exempla.re_search('Arma virumque cano'))
 
+    def test_re_search_many(self):
+        # should match each text as .re_search() would
+        exempla = EnglishText.re_search_many(
+            ['Lorem ipsum', EnglishText('Lorem'), 'Arma virumque'], 'Lorem'
+        )
+        comparanda = [True, True, False]
+        return self.assertEqual(exempla, comparanda)
+
+    def test_warmup(self):
+        # should load the shared tagger ahead of use
+        _get_pos_tagger.cache_clear()
+        EnglishText.warmup()
+        exempla = _get_pos_tagger.cache_info().currsize
+        comparanda = 1
+        return self.assertEqual(exempla, comparanda)
+
     def test_tokenize(self):
         # should return list of words
         exempla = EnglishText('The quick brown fox jumped over the lazy dog')
@@ -84,6 +238,33 @@ class TestEnglishText(unittest.TestCase):
         exempla = exempla.tokenize()
         return self.assertEqual(exempla, comparanda)
 
+    def test_tokenize_memoized(self):
+        # altering a returned list should not alter later results
+        exempla = EnglishText('Lorem ipsum, dolor sit amet')
+        exempla.tokenize(mode='wordpunct').append('consectetur')
+        comparanda = ['Lorem', 'ipsum', ',', 'dolor', 'sit', 'amet']
+        exempla = exempla.tokenize(mode='wordpunct')
+        return self.assertEqual(exempla, comparanda)
+
+    def test_tokenize_fast(self):
+        # should split words from punctuation without nltk data
+        exempla = EnglishText(
+            "Lorem ipsum, dolor sit amet.", options={'fast_tokenize': True}
+        )
+        comparanda = ['Lorem', 'ipsum', ',', 'dolor', 'sit', 'amet', '.']
+        exempla = exempla.tokenize()
+        return self.assertEqual(exempla, comparanda)
+
+    def test_tokenize_many(self):
+        # should tokenize each text, repeated texts included
+        exempla = EnglishText.tokenize_many(
+            ['Lorem ipsum.', 'dolor sit', 'Lorem ipsum.'],
+            mode='wordpunct', workers=2
+        )
+        comparanda = [['Lorem', 'ipsum', '.'], ['dolor', 'sit']]
+        comparanda.append(comparanda[0])
+        return self.assertEqual(exempla, comparanda)
+
     def test_lemmatize(self):
         # should give lemmatized version of text
         exempla = EnglishText('The quick brown fox jumped over the lazy dog')
@@ -150,6 +331,23 @@ class TestEnglishText(unittest.TestCase):
         exempla = exempla.skipgrams()
         return self.assertEqual(exempla, comparanda)
 
+    def test_tokenize_fast_mode(self):
+        # should split words from punctuation when asked for 'fast' mode
+        exempla = EnglishText("Lorem ipsum, dolor sit amet.")
+        comparanda = ['Lorem', 'ipsum', ',', 'dolor', 'sit', 'amet', '.']
+        exempla = exempla.tokenize(mode='fast')
+        return self.assertEqual(exempla, comparanda)
+
+    def test_iter_ngrams(self):
+        # should yield the same ngrams as .ngrams() gives
+        exempla = EnglishText(
+            "Lorem ipsum dolor sit", options={'fast_tokenize': True}
+        )
+        comparanda = [('Lorem', 'ipsum', 'dolor'), ('ipsum', 'dolor', 'sit')]
+        exempla = exempla.iter_ngrams()
+        self.assertNotIsInstance(exempla, list)
+        return self.assertEqual(list(exempla), comparanda)
+
     def test_word_count(self):
         # should return dictionary with word tallys
         exempla = EnglishText('The quick brown fox jumped over the lazy dog')
@@ -166,3 +364,12 @@ class TestEnglishText(unittest.TestCase):
         }
         exempla = exempla.word_count()
         return self.assertEqual(exempla, comparanda)
+
+    def test_word_count_absent(self):
+        # should count a word which never appears as 0
+        exempla = EnglishText(
+            'The quick brown fox', options={'fast_tokenize': True}
+        )
+        comparanda = 0
+        exempla = exempla.word_count('dog')
+        return self.assertEqual(exempla, comparanda)
@@ -4,7 +4,7 @@ import unittest
 
 import os
 
-from ..cltk import LatinText
+from ..cltk import LatinText, _get_lemma_replacer, _get_sentence_tokenizer
 
 
 class LatinSetupLayer:
@@ -24,6 +24,18 @@ class LatinSetupLayer:
 class TestLatinText(unittest.TestCase):
     layer = LatinSetupLayer
 
+    def test_warmup(self):
+        # Should load the shared sentence tokenizer and lemmatizer
+        _get_sentence_tokenizer.cache_clear()
+        _get_lemma_replacer.cache_clear()
+        LatinText.warmup()
+        exempla = [
+            _get_sentence_tokenizer.cache_info().currsize,
+            _get_lemma_replacer.cache_info().currsize
+        ]
+        comparanda = [1, 1]
+        return self.assertEqual(exempla, comparanda)
+
     def test_tokenize(self):
         # Should get type of string
         exempla = LatinText('Gallia est omnis divisa in partes tres')
@@ -46,6 +58,52 @@ class TestLatinText(unittest.TestCase):
         comparanda = 'gallia edo1 omne divido in pars tres'
         return self.assertEqual(exempla, comparanda)
 
+    def test_lemmatize_many(self):
+        # Should get same texts as lemmatizing each in turn
+        texts = ['Gallia est omnis divisa', 'in partes tres', 'in partes tres']
+        exempla = LatinText.lemmatize_many(texts)
+        comparanda = [LatinText(text).lemmatize() for text in texts]
+        return self.assertEqual(exempla, comparanda)
+
+    def test_lemmatize_many_list(self):
+        # Should get same lists of lemmata as lemmatizing each in turn
+        texts = ['Gallia est omnis divisa', 'in partes tres']
+        exempla = LatinText.lemmatize_many(texts, return_string=False)
+        exempla = [text.data for text in exempla]
+        comparanda = [
+            LatinText(text).lemmatize(return_string=False).data
+            for text in texts
+        ]
+        return self.assertEqual(exempla, comparanda)
+
+    def test_rm_stopwords(self):
+        # Should get text without cltk's latin stopwords
+        exempla = LatinText('Gallia est omnis divisa in partes tres')
+        exempla = exempla.rm_stopwords()
+        comparanda = 'Gallia omnis divisa partes tres'
+        return self.assertEqual(exempla, comparanda)
+
+    def test_lemmatize_list(self):
+        # Should get text holding the list of lemmata
+        exempla = LatinText('Gallia est omnis divisa in partes tres')
+        exempla = exempla.lemmatize(return_string=False)
+        comparanda = [
+            'gallia',
+            'edo1',
+            'omne',
+            'divido',
+            'in',
+            'pars',
+            'tres'
+        ]
+        return self.assertEqual(exempla.data, comparanda)
+
+    def test_list_data(self):
+        # Should keep non-string data as given
+        exempla = LatinText(['gallia', 'edo1'])
+        comparanda = ['gallia', 'edo1']
+        return self.assertEqual(exempla.data, comparanda)
+
     def test_scansion(self):
         # Should get type of string
         exempla = LatinText(
@@ -71,6 +129,36 @@ class TestLatinText(unittest.TestCase):
         comparanda = 'in partes tres'
         return self.assertEqual(exempla, comparanda)
 
+    def test_compare_longest_common_substring_empty(self):
+        # Should get empty string against empty text
+        exempla = LatinText('Gallia est omnis')
+        exempla = exempla.compare_longest_common_substring('')
+        comparanda = ''
+        return self.assertEqual(exempla, comparanda)
+
+    def test_compare_longest_common_substring_none(self):
+        # Should get empty string when no character is shared
+        exempla = LatinText('arma')
+        exempla = exempla.compare_longest_common_substring('quid')
+        comparanda = ''
+        return self.assertEqual(exempla, comparanda)
+
+    def test_compare_longest_common_substring_tie(self):
+        # Should get the earliest of equally long substrings
+        exempla = LatinText('arma cano')
+        exempla = exempla.compare_longest_common_substring('cano arma')
+        comparanda = 'arma'
+        return self.assertEqual(exempla, comparanda)
+
+    def test_compare_longest_common_substring_strip(self):
+        # Should get substring with surrounding spaces stripped
+        exempla = LatinText('Gallia est omnis')
+        exempla = exempla.compare_longest_common_substring(
+            'Belgae est omnis divisa'
+        )
+        comparanda = 'est omnis'
+        return self.assertEqual(exempla, comparanda)
+
     def test_compare_minhash(self):
         # Should get type of string
         exempla = LatinText('Gallia est omnis divisa in partes tres')
@@ -80,6 +168,17 @@ class TestLatinText(unittest.TestCase):
         comparanda = 0.6444444444444445
         return self.assertEqual(exempla, comparanda)
 
+    def test_compare_minhash_many(self):
+        # Should get one score per text, matching compare_minhash
+        exempla = LatinText('Gallia est omnis divisa in partes tres')
+        exempla = exempla.compare_minhash_many([
+            'Galliae sunt omnis divisae in partes tres',
+            'Gallia est omnis divisa in partes tres',
+            'in'
+        ])
+        comparanda = [0.6444444444444445, 1.0, 0.0]
+        return self.assertEqual(exempla, comparanda)
+
     def test_word_count(self):
         # Should get type of string
         exempla = LatinText('Gallia est omnis divisa in partes tres tres tres')
@@ -87,6 +186,13 @@ class TestLatinText(unittest.TestCase):
         comparanda = 3
         return self.assertEqual(exempla, comparanda)
 
+    def test_word_count_word(self):
+        # should count a single word, without punctuation
+        exempla = LatinText('Gallia est omnis divisa in partes tres, tres')
+        exempla = exempla.word_count(word='tres')
+        comparanda = 2
+        return self.assertEqual(exempla, comparanda)
+
     def test_macronize(self):
         # Should get type of string
         exempla = LatinText('Arma virumque cano, Troiae qui primus ab oris')